@@ -530,6 +530,10 @@ class Catalog(ABC):
         identifier: Union[str, Identifier],
         err: Union[Type[ValueError], Type[NoSuchTableError], Type[NoSuchNamespaceError]] = ValueError,
     ) -> Tuple[str, str]:
+        # an identifier that is already a (database, table) tuple needs no parsing
+        if isinstance(identifier, tuple) and len(identifier) == 2:
+            return identifier[0], identifier[1]
+
         tuple_identifier = Catalog.identifier_to_tuple(identifier)
         if len(tuple_identifier) != 2:
             raise err(f"Invalid path, hierarchical namespaces are not supported: {identifier}")
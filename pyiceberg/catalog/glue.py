@@ -16,21 +16,31 @@
 #  under the License.
 
 
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
 from typing import (
     Any,
+    Dict,
+    Iterator,
     List,
     Optional,
     Set,
+    Tuple,
     Union,
     cast,
 )
 
 import boto3
+from botocore.config import Config
+from botocore.credentials import AssumeRoleCredentialFetcher, DeferredRefreshableCredentials
+from botocore.exceptions import ClientError
+from botocore.session import get_session
 from mypy_boto3_glue.client import GlueClient
 from mypy_boto3_glue.type_defs import (
     DatabaseInputTypeDef,
     DatabaseTypeDef,
-    StorageDescriptorTypeDef,
     TableInputTypeDef,
     TableTypeDef,
 )
@@ -60,118 +70,276 @@ from pyiceberg.partitioning import UNPARTITIONED_PARTITION_SPEC, PartitionSpec
 from pyiceberg.schema import Schema
 from pyiceberg.serializers import FromInputFile
 from pyiceberg.table import CommitTableRequest, CommitTableResponse, Table
-from pyiceberg.table.metadata import new_table_metadata
+from pyiceberg.table.metadata import TableMetadata, new_table_metadata
 from pyiceberg.table.sorting import UNSORTED_SORT_ORDER, SortOrder
 from pyiceberg.typedef import EMPTY_DICT
 
+ASSUME_ROLE_ARN = "client.assume-role.arn"
+ASSUME_ROLE_EXTERNAL_ID = "client.assume-role.external-id"
+ASSUME_ROLE_SESSION_NAME = "client.assume-role.session-name"
 
-def _construct_parameters(metadata_location: str) -> Properties:
-    return {TABLE_TYPE: ICEBERG.upper(), METADATA_LOCATION: metadata_location}
+MAX_POOL_CONNECTIONS = "glue.max-pool-connections"
+MAX_POOL_CONNECTIONS_DEFAULT = 50
 
+LOAD_PARALLELISM = "glue.load-parallelism"
+LOAD_PARALLELISM_DEFAULT = 16
 
-def _construct_create_table_input(table_name: str, metadata_location: str, properties: Properties) -> TableInputTypeDef:
-    table_input: TableInputTypeDef = {
-        "Name": table_name,
-        "TableType": EXTERNAL_TABLE,
-        "Parameters": _construct_parameters(metadata_location),
-    }
+NAMESPACE_CACHE_TTL = "glue.namespace-cache-ttl"
+NAMESPACE_CACHE_TTL_DEFAULT = 30.0
+
+RETRY_MAX_ATTEMPTS = "glue.retry-max-attempts"
+RETRY_MAX_ATTEMPTS_DEFAULT = 10
+RETRY_MODE = "glue.retry-mode"
+RETRY_MODE_DEFAULT = "adaptive"
+
+# Error codes Glue surfaces under sustained load that are safe to retry
+_RETRYABLE_ERROR_CODES = ("ThrottlingException", "OperationTimeoutException")
+_BACKOFF_MAX_ATTEMPTS = 10
+_BACKOFF_MULTIPLIER = 0.1
+_BACKOFF_MAX_WAIT = 30.0
+
+# The table_type parameter value as written by _construct_parameters
+_ICEBERG_UPPER = ICEBERG.upper()
+
+# Number of parsed metadata files kept around per catalog; metadata files are written once
+# under a unique name, so a cached entry never goes stale.
+_METADATA_CACHE_SIZE = 1024
 
-    if "Description" in properties:
-        table_input["Description"] = properties["Description"]
 
-    return table_input
+def _construct_parameters(metadata_location: str) -> Properties:
+    return {TABLE_TYPE: _ICEBERG_UPPER, METADATA_LOCATION: metadata_location}
+
+
+def _construct_create_table_input(table_name: str, metadata_location: str, properties: Properties) -> TableInputTypeDef:
+    return cast(
+        TableInputTypeDef,
+        {
+            "Name": table_name,
+            "TableType": EXTERNAL_TABLE,
+            "Parameters": _construct_parameters(metadata_location),
+            **({"Description": properties["Description"]} if "Description" in properties else {}),
+        },
+    )
 
 
 def _construct_rename_table_input(to_table_name: str, glue_table: TableTypeDef) -> TableInputTypeDef:
-    rename_table_input: TableInputTypeDef = {"Name": to_table_name}
     # use the same Glue info to create the new table, pointing to the old metadata
     assert glue_table["TableType"]
-    rename_table_input["TableType"] = glue_table["TableType"]
-    if "Owner" in glue_table:
-        rename_table_input["Owner"] = glue_table["Owner"]
-
-    if "Parameters" in glue_table:
-        rename_table_input["Parameters"] = glue_table["Parameters"]
+    # It turns out the output of StorageDescriptor is not the same as the input type
+    # because the Column can have a different type, but for now it seems to work, so
+    # the cast silences the type error.
+    return cast(
+        TableInputTypeDef,
+        {
+            "Name": to_table_name,
+            "TableType": glue_table["TableType"],
+            **({"Owner": glue_table["Owner"]} if "Owner" in glue_table else {}),
+            **({"Parameters": glue_table["Parameters"]} if "Parameters" in glue_table else {}),
+            **({"StorageDescriptor": glue_table["StorageDescriptor"]} if "StorageDescriptor" in glue_table else {}),
+            **({"Description": glue_table["Description"]} if "Description" in glue_table else {}),
+        },
+    )
+
+
+# Catalog properties that are passed through to the boto3 session
+_SESSION_PROPERTY_KEYS = (
+    "profile_name",
+    "region_name",
+    "botocore_session",
+    "aws_access_key_id",
+    "aws_secret_access_key",
+    "aws_session_token",
+)
 
-    if "StorageDescriptor" in glue_table:
-        # It turns out the output of StorageDescriptor is not the same as the input type
-        # because the Column can have a different type, but for now it seems to work, so
-        # silence the type error.
-        rename_table_input["StorageDescriptor"] = cast(StorageDescriptorTypeDef, glue_table["StorageDescriptor"])
+# Properties that map to dedicated DatabaseInput fields instead of the Parameters dict
+_DATABASE_INPUT_PROPERTY_KEYS = {"Description": "Description", LOCATION: "LocationUri"}
 
-    if "Description" in glue_table:
-        rename_table_input["Description"] = glue_table["Description"]
 
-    return rename_table_input
+def _construct_database_input(database_name: str, properties: Properties) -> DatabaseInputTypeDef:
+    fields = {input_key: properties[key] for key, input_key in _DATABASE_INPUT_PROPERTY_KEYS.items() if key in properties}
+    parameters = {key: value for key, value in properties.items() if key not in _DATABASE_INPUT_PROPERTY_KEYS}
+    return cast(DatabaseInputTypeDef, {"Name": database_name, "Parameters": parameters, **fields})
+
+
+def _assume_role_session(session: boto3.Session, role_arn: str, properties: Properties) -> boto3.Session:
+    """Return a session whose credentials are refreshed in-process by assuming the given role.
+
+    Refreshing the credentials inside one long-lived session keeps a single Glue client and
+    its HTTP connection pool alive across credential rotations, instead of forcing callers
+    to build a new session (and connection pool) around every sts.assume_role call.
+
+    Args:
+        session: The session holding the source credentials.
+        role_arn: The ARN of the role to assume.
+        properties: Catalog properties, read for the optional external id and session name.
+
+    Returns:
+        boto3.Session: A session backed by auto-refreshing assumed-role credentials.
+    """
+    extra_args = {}
+    if external_id := properties.get(ASSUME_ROLE_EXTERNAL_ID):
+        extra_args["ExternalId"] = external_id
+    if session_name := properties.get(ASSUME_ROLE_SESSION_NAME):
+        extra_args["RoleSessionName"] = session_name
+
+    fetcher = AssumeRoleCredentialFetcher(
+        client_creator=session._session.create_client,
+        source_credentials=session._session.get_credentials(),
+        role_arn=role_arn,
+        extra_args=extra_args,
+    )
+    botocore_session = get_session()
+    botocore_session._credentials = DeferredRefreshableCredentials(
+        method="assume-role", refresh_using=fetcher.fetch_credentials
+    )
+    return boto3.Session(botocore_session=botocore_session, region_name=properties.get("region_name"))
+
+
+def _validate_iceberg_glue_table(glue_table: TableTypeDef) -> str:
+    """Check that a Glue table is a valid Iceberg table, without reading its metadata file.
+
+    Args:
+        glue_table: The Glue table response to validate.
+
+    Returns:
+        str: The metadata location of the table.
+
+    Raises:
+        NoSuchPropertyException: When the table is missing a required property.
+        NoSuchIcebergTableError: When the table is not an Iceberg table.
+    """
+    properties: Properties = glue_table["Parameters"]
+
+    assert glue_table["DatabaseName"]
+    assert glue_table["Parameters"]
+    database_name = glue_table["DatabaseName"]
+    table_name = glue_table["Name"]
+
+    if TABLE_TYPE not in properties:
+        raise NoSuchPropertyException(f"Property {TABLE_TYPE} missing, could not determine type: {database_name}.{table_name}")
+    glue_table_type = properties[TABLE_TYPE]
+
+    # equality against the canonical spelling short-circuits the .lower() allocation on
+    # tables written by this catalog; the fallback keeps the check case-insensitive
+    if glue_table_type != _ICEBERG_UPPER and glue_table_type.lower() != ICEBERG:
+        raise NoSuchIcebergTableError(
+            f"Property table_type is {glue_table_type}, expected {ICEBERG}: {database_name}.{table_name}"
+        )
 
+    if METADATA_LOCATION not in properties:
+        raise NoSuchPropertyException(
+            f"Table property {METADATA_LOCATION} is missing, cannot find metadata for: {database_name}.{table_name}"
+        )
+    return properties[METADATA_LOCATION]
 
-def _construct_database_input(database_name: str, properties: Properties) -> DatabaseInputTypeDef:
-    database_input: DatabaseInputTypeDef = {"Name": database_name}
-    parameters = {}
-    for k, v in properties.items():
-        if k == "Description":
-            database_input["Description"] = v
-        elif k == LOCATION:
-            database_input["LocationUri"] = v
-        else:
-            parameters[k] = v
-    database_input["Parameters"] = parameters
-    return database_input
 
+class _ThrottleAwareGlueClient:
+    """Thin proxy over the Glue client that retries throttled calls with jittered backoff.
 
-class GlueCatalog(Catalog):
-    def __init__(self, name: str, **properties: Any):
-        super().__init__(name, **properties)
+    botocore's adaptive retry mode paces requests client-side, but under sustained
+    parallel fan-out Glue can still surface throttling responses once those retries are
+    exhausted. Calls made through this proxy back off exponentially with random jitter
+    before giving up, so bursts degrade into slower progress instead of failures.
+    """
 
-        session = boto3.Session(
-            profile_name=properties.get("profile_name"),
-            region_name=properties.get("region_name"),
-            botocore_session=properties.get("botocore_session"),
-            aws_access_key_id=properties.get("aws_access_key_id"),
-            aws_secret_access_key=properties.get("aws_secret_access_key"),
-            aws_session_token=properties.get("aws_session_token"),
-        )
-        self.glue: GlueClient = session.client("glue")
+    def __init__(self, client: GlueClient) -> None:
+        self._client = client
 
-    def _convert_glue_to_iceberg(self, glue_table: TableTypeDef) -> Table:
-        properties: Properties = glue_table["Parameters"]
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if not callable(attr):
+            return attr
 
-        assert glue_table["DatabaseName"]
-        assert glue_table["Parameters"]
-        database_name = glue_table["DatabaseName"]
-        table_name = glue_table["Name"]
+        def call_with_backoff(*args: Any, **kwargs: Any) -> Any:
+            for attempt in range(1, _BACKOFF_MAX_ATTEMPTS + 1):
+                try:
+                    return attr(*args, **kwargs)
+                except ClientError as e:
+                    if attempt == _BACKOFF_MAX_ATTEMPTS or e.response.get("Error", {}).get("Code") not in _RETRYABLE_ERROR_CODES:
+                        raise
+                    time.sleep(random.uniform(0, min(_BACKOFF_MAX_WAIT, _BACKOFF_MULTIPLIER * 2**attempt)))
+            raise RuntimeError(f"Unreachable: {name} neither returned nor raised")
 
-        if TABLE_TYPE not in properties:
-            raise NoSuchPropertyException(
-                f"Property {TABLE_TYPE} missing, could not determine type: {database_name}.{table_name}"
-            )
-        glue_table_type = properties[TABLE_TYPE]
+        return call_with_backoff
 
-        if glue_table_type.lower() != ICEBERG:
-            raise NoSuchIcebergTableError(
-                f"Property table_type is {glue_table_type}, expected {ICEBERG}: {database_name}.{table_name}"
-            )
 
-        if METADATA_LOCATION not in properties:
-            raise NoSuchPropertyException(
-                f"Table property {METADATA_LOCATION} is missing, cannot find metadata for: {database_name}.{table_name}"
-            )
-        metadata_location = properties[METADATA_LOCATION]
+class GlueCatalog(Catalog):
+    def __init__(self, name: str, **properties: Any):
+        super().__init__(name, **properties)
 
+        session = boto3.Session(**{key: properties[key] for key in _SESSION_PROPERTY_KEYS if key in properties})
+        if assume_role_arn := properties.get(ASSUME_ROLE_ARN):
+            session = _assume_role_session(session, assume_role_arn, properties)
+        # The default client config queues requests behind 10 pooled connections and gives up
+        # quickly under Glue throttling; size the pool for concurrent table loads and let
+        # botocore's adaptive retry mode back off client-side.
+        config = Config(
+            max_pool_connections=int(properties.get(MAX_POOL_CONNECTIONS, MAX_POOL_CONNECTIONS_DEFAULT)),
+            retries={
+                "max_attempts": int(properties.get(RETRY_MAX_ATTEMPTS, RETRY_MAX_ATTEMPTS_DEFAULT)),
+                "mode": properties.get(RETRY_MODE, RETRY_MODE_DEFAULT),
+            },
+        )
+        self.glue: GlueClient = session.client("glue", config=config)
+        self._glue = _ThrottleAwareGlueClient(self.glue)
+        self._cached_table_metadata = lru_cache(maxsize=_METADATA_CACHE_SIZE)(self._read_table_metadata)
+        self._namespace_cache_ttl = float(properties.get(NAMESPACE_CACHE_TTL, NAMESPACE_CACHE_TTL_DEFAULT))
+        self._database_cache: Dict[str, Tuple[float, DatabaseTypeDef]] = {}
+
+    @cached_property
+    def _executor(self) -> ThreadPoolExecutor:
+        """Thread pool for fanning out Glue and object-store calls, sized to stay within the client connection pool."""
+        return ThreadPoolExecutor(max_workers=int(self.properties.get(LOAD_PARALLELISM, LOAD_PARALLELISM_DEFAULT)))
+
+    def _read_table_metadata(self, metadata_location: str) -> TableMetadata:
         io = load_file_io(properties=self.properties, location=metadata_location)
-        file = io.new_input(metadata_location)
-        metadata = FromInputFile.table_metadata(file)
+        return FromInputFile.table_metadata(io.new_input(metadata_location))
+
+    def _convert_glue_to_iceberg(self, glue_table: TableTypeDef) -> Table:
+        metadata_location = _validate_iceberg_glue_table(glue_table)
+        metadata = self._cached_table_metadata(metadata_location)
         return Table(
-            identifier=(self.name, database_name, table_name),
+            identifier=(self.name, glue_table["DatabaseName"], glue_table["Name"]),
             metadata=metadata,
             metadata_location=metadata_location,
             io=self._load_file_io(metadata.properties, metadata_location),
             catalog=self,
         )
 
+    def _get_glue_database(self, database_name: str) -> DatabaseTypeDef:
+        """Fetch a Glue database, serving repeated reads from a short-lived in-process cache.
+
+        Namespace metadata rarely changes, so reads within the TTL window (the
+        `glue.namespace-cache-ttl` property, in seconds; set to 0 to disable caching) skip
+        the get_database round-trip. Local writes invalidate the cached entry.
+        """
+        if cached := self._database_cache.get(database_name):
+            expires_at, database = cached
+            if time.monotonic() < expires_at:
+                return database
+
+        try:
+            database_response = self._glue.get_database(Name=database_name)
+        except self.glue.exceptions.EntityNotFoundException as e:
+            raise NoSuchNamespaceError(f"Database does not exist: {database_name}") from e
+        except self.glue.exceptions.InvalidInputException as e:
+            raise NoSuchNamespaceError(f"Invalid input for namespace {database_name}") from e
+
+        database = database_response["Database"]
+        if self._namespace_cache_ttl > 0:
+            self._database_cache[database_name] = (time.monotonic() + self._namespace_cache_ttl, database)
+        return database
+
+    def _get_glue_table(self, database_name: str, table_name: str) -> TableTypeDef:
+        try:
+            load_table_response = self._glue.get_table(DatabaseName=database_name, Name=table_name)
+        except self.glue.exceptions.EntityNotFoundException as e:
+            raise NoSuchTableError(f"Table does not exist: {database_name}.{table_name}") from e
+        return load_table_response["Table"]
+
     def _create_glue_table(self, database_name: str, table_name: str, table_input: TableInputTypeDef) -> None:
         try:
-            self.glue.create_table(DatabaseName=database_name, TableInput=table_input)
+            self._glue.create_table(DatabaseName=database_name, TableInput=table_input)
         except self.glue.exceptions.AlreadyExistsException as e:
             raise TableAlreadyExistsError(f"Table {database_name}.{table_name} already exists") from e
         except self.glue.exceptions.EntityNotFoundException as e:
@@ -216,7 +384,6 @@ class GlueCatalog(Catalog):
         self._write_metadata(metadata, io, metadata_location)
 
         table_input = _construct_create_table_input(table_name, metadata_location, properties)
-        database_name, table_name = self.identifier_to_database_and_table(identifier)
         self._create_glue_table(database_name=database_name, table_name=table_name, table_input=table_input)
 
         return self.load_table(identifier=identifier)
@@ -267,12 +434,32 @@ class GlueCatalog(Catalog):
         """
         identifier_tuple = self.identifier_to_tuple_without_catalog(identifier)
         database_name, table_name = self.identifier_to_database_and_table(identifier_tuple, NoSuchTableError)
-        try:
-            load_table_response = self.glue.get_table(DatabaseName=database_name, Name=table_name)
-        except self.glue.exceptions.EntityNotFoundException as e:
-            raise NoSuchTableError(f"Table does not exist: {database_name}.{table_name}") from e
 
-        return self._convert_glue_to_iceberg(load_table_response["Table"])
+        return self._convert_glue_to_iceberg(self._get_glue_table(database_name, table_name))
+
+    def load_tables(self, identifiers: List[Union[str, Identifier]]) -> List[Table]:
+        """Load the metadata of multiple tables concurrently and return the table instances.
+
+        Glue has no batch get-table API, so each table requires its own `get_table` round-trip.
+        Issuing them from a thread pool overlaps the network waits instead of paying one
+        round-trip per table sequentially; the metadata reads that follow are fanned out on
+        the same pool. The parallelism is bounded by the `glue.load-parallelism` property.
+
+        Args:
+            identifiers: List of table identifiers.
+
+        Returns:
+            List[Table]: the table instances, in the same order as the identifiers.
+
+        Raises:
+            NoSuchTableError: If a table with the name does not exist, or the identifier is invalid.
+        """
+        database_and_table_names = [
+            self.identifier_to_database_and_table(self.identifier_to_tuple_without_catalog(identifier), NoSuchTableError)
+            for identifier in identifiers
+        ]
+        glue_tables = list(self._executor.map(lambda names: self._get_glue_table(*names), database_and_table_names))
+        return list(self._executor.map(self._convert_glue_to_iceberg, glue_tables))
 
     def drop_table(self, identifier: Union[str, Identifier]) -> None:
         """Drop a table.
@@ -286,7 +473,7 @@ class GlueCatalog(Catalog):
         identifier_tuple = self.identifier_to_tuple_without_catalog(identifier)
         database_name, table_name = self.identifier_to_database_and_table(identifier_tuple, NoSuchTableError)
         try:
-            self.glue.delete_table(DatabaseName=database_name, Name=table_name)
+            self._glue.delete_table(DatabaseName=database_name, Name=table_name)
         except self.glue.exceptions.EntityNotFoundException as e:
             raise NoSuchTableError(f"Table does not exist: {database_name}.{table_name}") from e
 
@@ -313,15 +500,16 @@ class GlueCatalog(Catalog):
         from_database_name, from_table_name = self.identifier_to_database_and_table(from_identifier_tuple, NoSuchTableError)
         to_database_name, to_table_name = self.identifier_to_database_and_table(to_identifier)
         try:
-            get_table_response = self.glue.get_table(DatabaseName=from_database_name, Name=from_table_name)
+            get_table_response = self._glue.get_table(DatabaseName=from_database_name, Name=from_table_name)
         except self.glue.exceptions.EntityNotFoundException as e:
             raise NoSuchTableError(f"Table does not exist: {from_database_name}.{from_table_name}") from e
 
         glue_table = get_table_response["Table"]
 
         try:
-            # verify that from_identifier is a valid iceberg table
-            self._convert_glue_to_iceberg(glue_table=glue_table)
+            # verify that from_identifier is a valid iceberg table; validation alone is
+            # enough here, so the metadata file does not need to be fetched
+            _validate_iceberg_glue_table(glue_table)
         except NoSuchPropertyException as e:
             raise NoSuchPropertyException(
                 f"Failed to rename table {from_database_name}.{from_table_name} since it is missing required properties"
@@ -332,11 +520,16 @@ class GlueCatalog(Catalog):
             ) from e
 
         rename_table_input = _construct_rename_table_input(to_table_name=to_table_name, glue_table=glue_table)
-        self._create_glue_table(database_name=to_database_name, table_name=to_table_name, table_input=rename_table_input)
+        # creating the new table and dropping the old one are independent once the source
+        # payload is in hand; run both concurrently and reconcile on partial failure
+        create_future = self._executor.submit(
+            self._create_glue_table, database_name=to_database_name, table_name=to_table_name, table_input=rename_table_input
+        )
+        drop_future = self._executor.submit(self.drop_table, from_identifier)
+        create_error = create_future.exception()
+        drop_error = drop_future.exception()
 
-        try:
-            self.drop_table(from_identifier)
-        except Exception as e:
+        if create_error is None and drop_error is not None:
             log_message = f"Failed to drop old table {from_database_name}.{from_table_name}. "
 
             try:
@@ -347,9 +540,28 @@ class GlueCatalog(Catalog):
                     f"Failed to roll back table creation for {to_database_name}.{to_table_name}. " f"Please clean up manually"
                 )
 
-            raise ValueError(log_message) from e
-
-        return self.load_table(to_identifier)
+            raise ValueError(log_message) from drop_error
+
+        if create_error is not None:
+            if drop_error is None:
+                # the old table is already gone; restore it from the payload we still hold
+                try:
+                    self._create_glue_table(
+                        database_name=from_database_name,
+                        table_name=from_table_name,
+                        table_input=_construct_rename_table_input(to_table_name=from_table_name, glue_table=glue_table),
+                    )
+                except Exception:
+                    raise ValueError(
+                        f"Failed to create new table {to_database_name}.{to_table_name} and to restore "
+                        f"{from_database_name}.{from_table_name}. Please clean up manually"
+                    ) from create_error
+            raise create_error
+
+        # Glue already returned everything needed to build the table instance; synthesize
+        # the renamed payload locally instead of fetching it back with another get_table
+        renamed_glue_table = cast(TableTypeDef, {**glue_table, "Name": to_table_name, "DatabaseName": to_database_name})
+        return self._convert_glue_to_iceberg(renamed_glue_table)
 
     def create_namespace(self, namespace: Union[str, Identifier], properties: Properties = EMPTY_DICT) -> None:
         """Create a namespace in the catalog.
@@ -363,8 +575,9 @@ class GlueCatalog(Catalog):
             AlreadyExistsError: If a namespace with the given name already exists.
         """
         database_name = self.identifier_to_database(namespace)
+        self._database_cache.pop(database_name, None)
         try:
-            self.glue.create_database(DatabaseInput=_construct_database_input(database_name, properties))
+            self._glue.create_database(DatabaseInput=_construct_database_input(database_name, properties))
         except self.glue.exceptions.AlreadyExistsException as e:
             raise NamespaceAlreadyExistsError(f"Database {database_name} already exists") from e
 
@@ -382,46 +595,58 @@ class GlueCatalog(Catalog):
         """
         database_name = self.identifier_to_database(namespace, NoSuchNamespaceError)
         try:
-            table_list = self.list_tables(namespace=database_name)
-        except NoSuchNamespaceError as e:
+            # a single table is enough to answer the emptiness check, so there is no need
+            # to page through the full table list
+            table_list_response = self._glue.get_tables(DatabaseName=database_name, MaxResults=1)
+        except self.glue.exceptions.EntityNotFoundException as e:
             raise NoSuchNamespaceError(f"Database does not exist: {database_name}") from e
 
-        if len(table_list) > 0:
+        if table_list_response["TableList"]:
             raise NamespaceNotEmptyError(f"Database {database_name} is not empty")
 
-        self.glue.delete_database(Name=database_name)
+        self._database_cache.pop(database_name, None)
+        self._glue.delete_database(Name=database_name)
 
-    def list_tables(self, namespace: Union[str, Identifier]) -> List[Identifier]:
-        """List tables under the given namespace in the catalog (including non-Iceberg tables).
+    def iter_tables(self, namespace: Union[str, Identifier]) -> Iterator[Identifier]:
+        """Iterate over the tables under the given namespace (including non-Iceberg tables), page by page.
+
+        Pages are fetched lazily, so consumers that stop early — an existence check, or a
+        filter that matches within the first page — only pay for the pages they consume.
 
         Args:
             namespace (str | Identifier): Namespace identifier to search.
 
-        Returns:
-            List[Identifier]: list of table identifiers.
+        Yields:
+            Identifier: table identifiers.
 
         Raises:
             NoSuchNamespaceError: If a namespace with the given name does not exist, or the identifier is invalid.
         """
         database_name = self.identifier_to_database(namespace, NoSuchNamespaceError)
-        table_list: List[TableTypeDef] = []
-        next_token: Optional[str] = None
+        page_iterator = iter(self.glue.get_paginator("get_tables").paginate(DatabaseName=database_name))
         try:
-            table_list_response = self.glue.get_tables(DatabaseName=database_name)
-            while True:
-                table_list_response = (
-                    self.glue.get_tables(DatabaseName=database_name)
-                    if not next_token
-                    else self.glue.get_tables(DatabaseName=database_name, NextToken=next_token)
-                )
-                table_list.extend(table_list_response["TableList"])
-                next_token = table_list_response.get("NextToken")
-                if not next_token:
-                    break
-
+            # pull pages through the executor so the next page is fetched while the current one is consumed
+            next_page = self._executor.submit(next, page_iterator, None)
+            while (page := next_page.result()) is not None:
+                next_page = self._executor.submit(next, page_iterator, None)
+                for table in page["TableList"]:
+                    yield (database_name, table["Name"])
         except self.glue.exceptions.EntityNotFoundException as e:
             raise NoSuchNamespaceError(f"Database does not exist: {database_name}") from e
-        return [(database_name, table["Name"]) for table in table_list]
+
+    def list_tables(self, namespace: Union[str, Identifier]) -> List[Identifier]:
+        """List tables under the given namespace in the catalog (including non-Iceberg tables).
+
+        Args:
+            namespace (str | Identifier): Namespace identifier to search.
+
+        Returns:
+            List[Identifier]: list of table identifiers.
+
+        Raises:
+            NoSuchNamespaceError: If a namespace with the given name does not exist, or the identifier is invalid.
+        """
+        return list(self.iter_tables(namespace))
 
     def list_namespaces(self, namespace: Union[str, Identifier] = ()) -> List[Identifier]:
         """List namespaces from the given namespace. If not given, list top-level namespaces from the catalog.
@@ -434,15 +659,13 @@ class GlueCatalog(Catalog):
             return []
 
         database_list: List[DatabaseTypeDef] = []
-        databases_response = self.glue.get_databases()
-        next_token: Optional[str] = None
+        page_iterator = iter(self.glue.get_paginator("get_databases").paginate())
 
-        while True:
-            databases_response = self.glue.get_databases() if not next_token else self.glue.get_databases(NextToken=next_token)
-            database_list.extend(databases_response["DatabaseList"])
-            next_token = databases_response.get("NextToken")
-            if not next_token:
-                break
+        # pull pages through the executor so the next page is fetched while the current one is processed
+        next_page = self._executor.submit(next, page_iterator, None)
+        while (page := next_page.result()) is not None:
+            next_page = self._executor.submit(next, page_iterator, None)
+            database_list.extend(page["DatabaseList"])
 
         return [self.identifier_to_tuple(database["Name"]) for database in database_list]
 
@@ -459,14 +682,7 @@ class GlueCatalog(Catalog):
             NoSuchNamespaceError: If a namespace with the given name does not exist, or identifier is invalid.
         """
         database_name = self.identifier_to_database(namespace, NoSuchNamespaceError)
-        try:
-            database_response = self.glue.get_database(Name=database_name)
-        except self.glue.exceptions.EntityNotFoundException as e:
-            raise NoSuchNamespaceError(f"Database does not exist: {database_name}") from e
-        except self.glue.exceptions.InvalidInputException as e:
-            raise NoSuchNamespaceError(f"Invalid input for namespace {database_name}") from e
-
-        database = database_response["Database"]
+        database = self._get_glue_database(database_name)
 
         properties = dict(database.get("Parameters", {}))
         if "LocationUri" in database:
@@ -496,6 +712,7 @@ class GlueCatalog(Catalog):
         )
 
         database_name = self.identifier_to_database(namespace, NoSuchNamespaceError)
-        self.glue.update_database(Name=database_name, DatabaseInput=_construct_database_input(database_name, updated_properties))
+        self._database_cache.pop(database_name, None)
+        self._glue.update_database(Name=database_name, DatabaseInput=_construct_database_input(database_name, updated_properties))
 
         return properties_update_summary
@@ -19,7 +19,7 @@ from __future__ import annotations
 import codecs
 import gzip
 from abc import ABC, abstractmethod
-from typing import Callable
+from typing import Callable, Union
 
 from pyiceberg.io import InputFile, InputStream, OutputFile
 from pyiceberg.table.metadata import TableMetadata, TableMetadataUtil
@@ -87,9 +87,12 @@ class FromByteStream:
             compression: Optional compression method
         """
         with compression.stream_decompressor(byte_stream) as byte_stream:
-            reader = codecs.getreader(encoding)
-            json_bytes = reader(byte_stream)
-            metadata = json_bytes.read()
+            if encoding == UTF8:
+                # pydantic-core's JSON parser is implemented in Rust and consumes UTF-8 bytes
+                # directly, so skip the Python-level decode and its extra copy of the payload
+                metadata: Union[str, bytes] = byte_stream.read()
+            else:
+                metadata = codecs.getreader(encoding)(byte_stream).read()
 
         return TableMetadataUtil.parse_raw(metadata)
 
@@ -434,7 +434,7 @@ class TableMetadataUtil:
     """Helper class for parsing TableMetadata."""
 
     @staticmethod
-    def parse_raw(data: str) -> TableMetadata:
+    def parse_raw(data: Union[str, bytes]) -> TableMetadata:
         try:
             return TableMetadataWrapper.model_validate_json(data).root
         except PydanticValidationError as e:
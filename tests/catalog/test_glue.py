@@ -18,7 +18,8 @@ from typing import Any, Dict, List
 from unittest import mock
 
 import pytest
-from moto import mock_glue
+from botocore.exceptions import ClientError
+from moto import mock_glue, mock_sts
 
 from pyiceberg.catalog.glue import GlueCatalog
 from pyiceberg.exceptions import (
@@ -31,6 +32,7 @@ from pyiceberg.exceptions import (
     TableAlreadyExistsError,
 )
 from pyiceberg.schema import Schema
+from pyiceberg.serializers import FromInputFile
 from tests.conftest import BUCKET_NAME, TABLE_METADATA_LOCATION_REGEX
 
 
@@ -169,6 +171,54 @@ def test_load_table_from_self_identifier(
     assert TABLE_METADATA_LOCATION_REGEX.match(table.metadata_location)
 
 
+@mock_glue
+def test_load_table_reuses_cached_metadata(
+    _bucket_initialize: None, _patch_aiobotocore: None, table_schema_nested: Schema, database_name: str, table_name: str
+) -> None:
+    identifier = (database_name, table_name)
+    test_catalog = GlueCatalog("glue", **{"py-io-impl": "pyiceberg.io.fsspec.FsspecFileIO", "warehouse": f"s3://{BUCKET_NAME}/"})
+    test_catalog.create_namespace(namespace=database_name)
+    with mock.patch.object(FromInputFile, "table_metadata", wraps=FromInputFile.table_metadata) as mock_table_metadata:
+        test_catalog.create_table(identifier, table_schema_nested)
+        first = test_catalog.load_table(identifier)
+        second = test_catalog.load_table(identifier)
+    # the metadata file is immutable, so repeated loads are served from the cache
+    assert mock_table_metadata.call_count == 1
+    assert first.metadata == second.metadata
+
+
+@mock_glue
+def test_load_tables(
+    _bucket_initialize: None,
+    _patch_aiobotocore: None,
+    table_schema_nested: Schema,
+    database_name: str,
+    table_list: List[str],
+) -> None:
+    catalog_name = "glue"
+    test_catalog = GlueCatalog(
+        catalog_name, **{"py-io-impl": "pyiceberg.io.fsspec.FsspecFileIO", "warehouse": f"s3://{BUCKET_NAME}/"}
+    )
+    test_catalog.create_namespace(namespace=database_name)
+    identifiers = [(database_name, table_name) for table_name in table_list]
+    for identifier in identifiers:
+        test_catalog.create_table(identifier, table_schema_nested)
+    loaded_tables = test_catalog.load_tables(identifiers)
+    assert [table.identifier for table in loaded_tables] == [(catalog_name,) + identifier for identifier in identifiers]
+
+
+@mock_glue
+def test_load_tables_non_exist_table(
+    _bucket_initialize: None, _patch_aiobotocore: None, table_schema_nested: Schema, database_name: str, table_name: str
+) -> None:
+    identifier = (database_name, table_name)
+    test_catalog = GlueCatalog("glue", **{"py-io-impl": "pyiceberg.io.fsspec.FsspecFileIO", "warehouse": f"s3://{BUCKET_NAME}/"})
+    test_catalog.create_namespace(namespace=database_name)
+    test_catalog.create_table(identifier, table_schema_nested)
+    with pytest.raises(NoSuchTableError):
+        test_catalog.load_tables([identifier, (database_name, f"{table_name}_missing")])
+
+
 @mock_glue
 def test_load_non_exist_table(_bucket_initialize: None, _patch_aiobotocore: None, database_name: str, table_name: str) -> None:
     identifier = (database_name, table_name)
@@ -330,6 +380,57 @@ def test_list_tables(
         assert (database_name, table_name) in loaded_table_list
 
 
+@mock_glue
+def test_iter_tables_early_termination(
+    _bucket_initialize: None,
+    _patch_aiobotocore: None,
+    table_schema_nested: Schema,
+    database_name: str,
+    table_name: str,
+    table_list: List[str],
+) -> None:
+    test_catalog = GlueCatalog("glue", **{"py-io-impl": "pyiceberg.io.fsspec.FsspecFileIO", "warehouse": f"s3://{BUCKET_NAME}/"})
+    test_catalog.create_namespace(namespace=database_name)
+    for table_name in table_list:
+        test_catalog.create_table((database_name, table_name), table_schema_nested)
+    # an existence check only needs the first yielded identifier
+    first_table = next(test_catalog.iter_tables(database_name), None)
+    assert first_table is not None
+    assert first_table in test_catalog.list_tables(database_name)
+
+
+@mock_glue
+def test_iter_tables_non_exist_namespace(
+    _bucket_initialize: None, _patch_aiobotocore: None, database_name: str
+) -> None:
+    test_catalog = GlueCatalog("glue", **{"py-io-impl": "pyiceberg.io.fsspec.FsspecFileIO"})
+    with pytest.raises(NoSuchNamespaceError):
+        next(test_catalog.iter_tables(database_name), None)
+
+
+@mock_glue
+def test_list_tables_fetches_single_page_once(
+    _bucket_initialize: None, _patch_aiobotocore: None, table_schema_nested: Schema, database_name: str, table_name: str
+) -> None:
+    test_catalog = GlueCatalog("glue", **{"py-io-impl": "pyiceberg.io.fsspec.FsspecFileIO", "warehouse": f"s3://{BUCKET_NAME}/"})
+    test_catalog.create_namespace(namespace=database_name)
+    test_catalog.create_table((database_name, table_name), table_schema_nested)
+    with mock.patch.object(test_catalog.glue, "get_tables", wraps=test_catalog.glue.get_tables) as mock_get_tables:
+        test_catalog.list_tables(database_name)
+    assert mock_get_tables.call_count == 1
+
+
+@mock_glue
+def test_list_namespaces_fetches_single_page_once(
+    _bucket_initialize: None, _patch_aiobotocore: None, database_name: str
+) -> None:
+    test_catalog = GlueCatalog("glue", **{"py-io-impl": "pyiceberg.io.fsspec.FsspecFileIO"})
+    test_catalog.create_namespace(namespace=database_name)
+    with mock.patch.object(test_catalog.glue, "get_databases", wraps=test_catalog.glue.get_databases) as mock_get_databases:
+        test_catalog.list_namespaces()
+    assert mock_get_databases.call_count == 1
+
+
 @mock_glue
 def test_list_namespaces(_bucket_initialize: None, _patch_aiobotocore: None, database_list: List[str]) -> None:
     test_catalog = GlueCatalog("glue", **{"py-io-impl": "pyiceberg.io.fsspec.FsspecFileIO"})
@@ -431,6 +532,20 @@ def test_load_namespace_properties(_bucket_initialize: None, _patch_aiobotocore:
         assert v == test_properties[k]
 
 
+@mock_glue
+def test_load_namespace_properties_cached(_bucket_initialize: None, _patch_aiobotocore: None, database_name: str) -> None:
+    test_catalog = GlueCatalog("glue", **{"py-io-impl": "pyiceberg.io.fsspec.FsspecFileIO"})
+    test_catalog.create_namespace(database_name, {"comment": "this is a test description"})
+    with mock.patch.object(test_catalog.glue, "get_database", wraps=test_catalog.glue.get_database) as mock_get_database:
+        first = test_catalog.load_namespace_properties(database_name)
+        second = test_catalog.load_namespace_properties(database_name)
+    assert mock_get_database.call_count == 1
+    assert first == second
+    # a local write invalidates the cached entry
+    test_catalog.update_namespace_properties(database_name, updates={"comment": "updated test description"})
+    assert test_catalog.load_namespace_properties(database_name)["comment"] == "updated test description"
+
+
 @mock_glue
 def test_load_non_exist_namespace_properties(_bucket_initialize: None, _patch_aiobotocore: None, database_name: str) -> None:
     test_catalog = GlueCatalog("glue", **{"py-io-impl": "pyiceberg.io.fsspec.FsspecFileIO"})
@@ -519,3 +634,51 @@ def test_passing_profile_name() -> None:
 
     mock_session.assert_called_with(**session_properties)
     assert test_catalog.glue is mock_session().client()
+
+
+@mock_glue
+@mock_sts
+def test_assume_role_credentials(_bucket_initialize: None, _patch_aiobotocore: None, database_name: str) -> None:
+    test_catalog = GlueCatalog(
+        "glue",
+        **{
+            "py-io-impl": "pyiceberg.io.fsspec.FsspecFileIO",
+            "client.assume-role.arn": "arn:aws:iam::123456789012:role/glue-catalog-role",
+            "client.assume-role.session-name": "pyiceberg-test",
+        },
+    )
+    test_catalog.create_namespace(namespace=database_name)
+    assert (database_name,) in test_catalog.list_namespaces()
+
+
+@mock_glue
+def test_throttled_call_is_retried(_bucket_initialize: None, _patch_aiobotocore: None, database_name: str) -> None:
+    test_catalog = GlueCatalog("glue", **{"py-io-impl": "pyiceberg.io.fsspec.FsspecFileIO"})
+    test_catalog.create_namespace(namespace=database_name, properties={"comment": "this is a test description"})
+    throttling_error = ClientError({"Error": {"Code": "ThrottlingException"}}, "GetDatabase")
+    database_response = test_catalog.glue.get_database(Name=database_name)
+    with mock.patch.object(
+        test_catalog.glue, "get_database", side_effect=[throttling_error, throttling_error, database_response]
+    ) as mock_get_database:
+        properties = test_catalog.load_namespace_properties(database_name)
+    assert mock_get_database.call_count == 3
+    assert properties["comment"] == "this is a test description"
+
+
+@mock_glue
+def test_non_retryable_error_is_raised(_bucket_initialize: None, _patch_aiobotocore: None, database_name: str) -> None:
+    test_catalog = GlueCatalog("glue", **{"py-io-impl": "pyiceberg.io.fsspec.FsspecFileIO"})
+    access_denied_error = ClientError({"Error": {"Code": "AccessDeniedException"}}, "GetDatabase")
+    with mock.patch.object(test_catalog.glue, "get_database", side_effect=access_denied_error) as mock_get_database:
+        with pytest.raises(ClientError):
+            test_catalog.load_namespace_properties(database_name)
+    assert mock_get_database.call_count == 1
+
+
+@mock_glue
+def test_glue_client_config(_bucket_initialize: None, _patch_aiobotocore: None) -> None:
+    test_catalog = GlueCatalog("glue", **{"glue.max-pool-connections": "10", "glue.retry-max-attempts": "5"})
+    client_config = test_catalog.glue.meta.config
+    assert client_config.max_pool_connections == 10
+    # botocore normalizes max_attempts into total_max_attempts (initial call + retries)
+    assert client_config.retries == {"total_max_attempts": 6, "mode": "adaptive"}